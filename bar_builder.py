@@ -13,42 +13,69 @@ import numpy as np
 from arcticdb import Arctic
 from json import loads
 from datetime import time
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
 import logging
 from logging.handlers import RotatingFileHandler
 import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import current_process, get_context, shared_memory
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 ############
 # LOGGING
 ############
 
 def setup_logging(log_dir="logs"):
-    """Configure logging with both file and console handlers."""
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-
+    """
+    Configure logging with both file and console handlers. Worker processes
+    (see build_bars_parallel) re-import this module on Windows and only get
+    the console handler: several processes holding the rotating log file
+    open break its rollover.
+    """
     logger = logging.getLogger('bar_builder')
     logger.setLevel(logging.INFO)
 
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
     console_formatter = logging.Formatter(
         '%(asctime)s - %(levelname)s - %(message)s'
     )
 
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, 'bar_builder.log'),
-        maxBytes=10*1024*1024,
-        backupCount=5
-    )
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(file_formatter)
+    if current_process().name == 'MainProcess':
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
+        file_handler = RotatingFileHandler(
+            os.path.join(log_dir, 'bar_builder.log'),
+            maxBytes=10*1024*1024,
+            backupCount=5
+        )
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(file_formatter)
+        logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
-
-    logger.addHandler(file_handler)
     logger.addHandler(console_handler)
 
     return logger
@@ -62,27 +89,280 @@ logger = setup_logging()
 ARCTIC_HOST = "mongodb://localhost:27017"
 LIB_NAME    = "tick_data"
 
-try:
-    CONFIG = loads(open("./config.json").read())
-    UTC_OFFSET_US = int(CONFIG["utc_offset"] * 3.6e9)
-    SESSION_START = time.fromisoformat(CONFIG.get("session_start", "08:30:00"))
-    SESSION_END = time.fromisoformat(CONFIG.get("session_end", "15:00:00"))
-    NEW_BAR_AT_SESSION_START = CONFIG.get("new_bar_at_session_start", True)
-except Exception as e:
-    logger.error(f"Failed to load config: {str(e)}")
-    raise
+# Only the T&S columns bar construction needs; projected at read time
+TICK_COLUMNS = ["timestamp", "price", "qty"]
+
+DAY_NS = 86_400_000_000_000
+
+def _time_to_ns(t: time) -> int:
+    """Nanoseconds since midnight for a datetime.time."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000_000 + t.microsecond * 1_000
+
+def _index_ns(df: pd.DataFrame) -> np.ndarray:
+    """
+    The DatetimeIndex as int64 nanoseconds whatever its unit (pandas may
+    build 'us' or 's' indexes), for the ns arithmetic below.
+    """
+    return df.index.as_unit('ns').asi8
+
+class Settings(NamedTuple):
+    """Config values plus the int64 offsets derived from them."""
+    epoch_ns: int                    # Sierra Chart epoch in local time, ns
+    session_start: time
+    session_end: time
+    session_start_ns: int            # ns since midnight
+    session_end_ns: int
+    new_bar_at_session_start: bool
+    use_polars: bool
+
+@lru_cache(maxsize=1)
+def _cfg() -> dict:
+    """Parsed config.json, read once per process on first use."""
+    try:
+        return loads(Path("./config.json").read_text())
+    except Exception as e:
+        logger.error(f"Failed to load config: {str(e)}")
+        raise
+
+@lru_cache(maxsize=1)
+def _settings() -> Settings:
+    config = _cfg()
+    utc_offset_us = int(config["utc_offset"] * 3.6e9)
+    session_start = time.fromisoformat(config.get("session_start", "08:30:00"))
+    session_end = time.fromisoformat(config.get("session_end", "15:00:00"))
+
+    return Settings(
+        epoch_ns=int((
+            np.datetime64("1899-12-30") + np.timedelta64(utc_offset_us, "us")
+        ).astype("datetime64[ns]").astype(np.int64)),
+        session_start=session_start,
+        session_end=session_end,
+        session_start_ns=_time_to_ns(session_start),
+        session_end_ns=_time_to_ns(session_end),
+        new_bar_at_session_start=config.get("new_bar_at_session_start", True),
+        # Opt-in Polars time-bar path (BAR_BUILDER_POLARS=1, requires polars)
+        use_polars=pl is not None and os.environ.get("BAR_BUILDER_POLARS", "0") == "1"
+    )
 
 ############
 # ARCTIC
 ############
 
-try:
-    store = Arctic(ARCTIC_HOST)
-    arctic_lib = store[LIB_NAME]
-    logger.info("Successfully connected to ArcticDB")
-except Exception as e:
-    logger.error(f"Failed to connect to ArcticDB: {str(e)}")
-    raise
+@lru_cache(maxsize=1)
+def _get_lib():
+    """Connect to ArcticDB on first use, so importing workers stay offline."""
+    try:
+        store = Arctic(ARCTIC_HOST)
+        lib = store[LIB_NAME]
+        logger.info("Successfully connected to ArcticDB")
+        return lib
+    except Exception as e:
+        logger.error(f"Failed to connect to ArcticDB: {str(e)}")
+        raise
+
+############
+# KERNELS
+############
+
+OHLC_COLUMNS = ['open', 'high', 'low', 'close']
+
+# Bar prices are stored as float32, halving bar bytes written to/read from
+# Arctic. float32 has a 24-bit mantissa: every multiple of 0.25 below 2**22
+# (e.g. NQ/ES prices) is exact, and finer ticks stay within ~6e-8 relative
+# error, far below one tick at futures price levels. Volume stays int64.
+OHLC_DTYPE = np.float32
+
+@njit(cache=True, boundscheck=False)
+def _ohlcv_kernel(price, qty, ts, bar_ids):
+    """
+    Single pass over tick arrays, reducing each run of equal (non-decreasing)
+    bar_ids to one OHLCV bar. Outputs are preallocated to the exact bar count
+    (counted over bar_ids first) and OHLC is written into one column-major
+    (nbars, 4) array.
+    """
+    n = len(price)
+    nbars = 0
+    for i in range(n):
+        if i == 0 or bar_ids[i] != bar_ids[i - 1]:
+            nbars += 1
+
+    ohlc = np.empty((4, nbars), dtype=np.float32).T
+    volume = np.empty(nbars, dtype=np.int64)
+    t0 = np.empty(nbars, dtype=np.int64)
+    t1 = np.empty(nbars, dtype=np.int64)
+    ids = np.empty(nbars, dtype=np.int64)
+
+    k = -1
+    for i in range(n):
+        p = price[i]
+        if k < 0 or bar_ids[i] != ids[k]:
+            k += 1
+            ids[k] = bar_ids[i]
+            ohlc[k, 0] = p
+            ohlc[k, 1] = p
+            ohlc[k, 2] = p
+            volume[k] = 0
+            t0[k] = ts[i]
+        elif p > ohlc[k, 1]:
+            ohlc[k, 1] = p
+        elif p < ohlc[k, 2]:
+            ohlc[k, 2] = p
+        ohlc[k, 3] = p
+        volume[k] += qty[i]
+        t1[k] = ts[i]
+
+    return ids, ohlc, volume, t0, t1
+
+def _assemble_bars(index, ohlc, volume, t0, t1) -> pd.DataFrame:
+    """Wrap a column-major (nbars, 4) OHLC array plus volume/times as bars."""
+    return pd.DataFrame(ohlc, index=index, columns=OHLC_COLUMNS, copy=False).assign(
+        volume=volume,
+        bar_time_first=t0,
+        bar_time_last=t1
+    )
+
+def _kernel_bars(df: pd.DataFrame, bar_ids: np.ndarray) -> pd.DataFrame:
+    """Run _ohlcv_kernel over a session-filtered, time-sorted tick frame."""
+    ids, ohlc, volume, t0, t1 = _ohlcv_kernel(
+        df['price'].to_numpy(np.float64),
+        df['qty'].to_numpy(np.int64),
+        _index_ns(df),
+        np.asarray(bar_ids, dtype=np.int64)
+    )
+    return _assemble_bars(
+        ids, ohlc, volume, t0.view('datetime64[ns]'), t1.view('datetime64[ns]')
+    )
+
+def _reduce_ohlc(price: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Column-major (nbars, 4) OHLC_DTYPE array for contiguous runs of price."""
+    ohlc = np.empty((len(starts), 4), dtype=OHLC_DTYPE, order='F')
+    ohlc[:, 0] = price[starts]
+    # Reduce in float64 and then narrow: reducing straight into the
+    # uninitialized float32 column casts its garbage and can warn
+    ohlc[:, 1] = np.maximum.reduceat(price, starts)
+    ohlc[:, 2] = np.minimum.reduceat(price, starts)
+    ohlc[:, 3] = price[ends]
+    return ohlc
+
+def _reduce_bars(df: pd.DataFrame, bar_ids: np.ndarray) -> pd.DataFrame:
+    """
+    NumPy fallback for _kernel_bars: bar_ids are non-decreasing, so each bar
+    is a contiguous run of rows and reduces with ufunc.reduceat.
+    """
+    price = df['price'].to_numpy(np.float64)
+    qty = df['qty'].to_numpy()
+    ts = df.index.to_numpy()
+
+    starts = np.flatnonzero(np.diff(bar_ids, prepend=bar_ids[:1] - 1))
+    ends = np.append(starts[1:], len(bar_ids))[:len(starts)] - 1
+
+    return _assemble_bars(
+        np.asarray(bar_ids)[starts],
+        _reduce_ohlc(price, starts, ends),
+        np.add.reduceat(qty, starts),
+        ts[starts],
+        ts[ends]
+    )
+
+def _time_bin_origin(ns: np.ndarray, offset: pd.Timedelta) -> int:
+    """
+    Time-bar anchor matching pd.Grouper's default origin ('start_day'):
+    midnight of the first tick's day plus offset.
+    """
+    first = ns.min()
+    return int(first - first % DAY_NS + offset.value)
+
+def _intraday_bin_ns(freq: str):
+    """
+    Bin width in ns if freq is a fixed sub-daily frequency ('5Min', '1h',
+    ...), else None. Only those bin by plain int64 division the same way
+    pd.Grouper does; daily and calendar frequencies ('1D', 'W', 'ME')
+    have their own anchoring rules.
+    """
+    off = to_offset(freq)
+    if isinstance(off, Tick) and off.nanos < DAY_NS:
+        return off.nanos
+    return None
+
+def _grouper_time_bars(df: pd.DataFrame, freq: str, offset: pd.Timedelta) -> pd.DataFrame:
+    """
+    pd.Grouper time bars, for frequencies _intraday_bin_ns does not cover.
+    """
+    ohlcv = df.groupby(pd.Grouper(freq=freq, offset=offset)).agg({
+        'price': ['first', 'max', 'min', 'last'],
+        'qty': 'sum'
+    })
+    ohlcv.columns = OHLC_COLUMNS + ['volume']
+    ohlcv.dropna(subset=['open'], inplace=True)
+    return ohlcv.astype({col: OHLC_DTYPE for col in OHLC_COLUMNS})
+
+def _reduce_time_bars(df: pd.DataFrame, freq: str, offset: pd.Timedelta) -> pd.DataFrame:
+    """
+    Time bars for a sub-daily freq (see _intraday_bin_ns) in one reduceat
+    pass: the bin of each tick is a plain int64 division of its nanosecond
+    offset from the anchor, so no label-based groupby is needed. Empty bins
+    never appear.
+    """
+    ns = _index_ns(df)
+    if not len(ns):
+        return pd.DataFrame(
+            columns=OHLC_COLUMNS + ['volume'],
+            index=pd.DatetimeIndex([], name=df.index.name)
+        )
+
+    price = df['price'].to_numpy(np.float64)
+    qty = df['qty'].to_numpy()
+
+    # Time order within each bin, as the pandas Grouper would sort it
+    if not df.index.is_monotonic_increasing:
+        order = np.argsort(ns, kind='stable')
+        ns, price, qty = ns[order], price[order], qty[order]
+
+    bin_ns = _intraday_bin_ns(freq)
+    origin = _time_bin_origin(ns, offset)
+    bin_ids = (ns - origin) // bin_ns
+
+    starts = np.flatnonzero(np.diff(bin_ids, prepend=bin_ids[0] - 1))
+    ends = np.append(starts[1:], len(bin_ids)) - 1
+
+    index = pd.DatetimeIndex(
+        (origin + bin_ids[starts] * bin_ns).view('datetime64[ns]'), name=df.index.name
+    )
+    return pd.DataFrame(
+        _reduce_ohlc(price, starts, ends), index=index, columns=OHLC_COLUMNS, copy=False
+    ).assign(volume=np.add.reduceat(qty, starts))
+
+def _polars_time_bars(df: pd.DataFrame, freq: str, offset: pd.Timedelta) -> pd.DataFrame:
+    """
+    Polars group_by_dynamic equivalent of _reduce_time_bars (sub-daily freq
+    only), using the same bin anchor.
+    """
+    ns = _index_ns(df)
+    bin_ns = _intraday_bin_ns(freq)
+    origin = _time_bin_origin(ns, offset)
+
+    out = (
+        pl.DataFrame({
+            't': ns - origin,
+            'price': df['price'].to_numpy(),
+            'qty': df['qty'].to_numpy()
+        })
+        .sort('t', maintain_order=True)
+        .group_by_dynamic('t', every=f"{bin_ns}i", closed='left', label='left')
+        .agg([
+            pl.col('price').first().alias('open'),
+            pl.col('price').max().alias('high'),
+            pl.col('price').min().alias('low'),
+            pl.col('price').last().alias('close'),
+            pl.col('qty').sum().alias('volume')
+        ])
+    )
+
+    index = pd.DatetimeIndex(
+        (out['t'].to_numpy() + origin).view('datetime64[ns]'), name=df.index.name
+    )
+    ohlc = {col: out[col].to_numpy().astype(OHLC_DTYPE, copy=False) for col in OHLC_COLUMNS}
+    return pd.DataFrame({**ohlc, 'volume': out['volume'].to_numpy()}, index=index)
 
 ############
 # FUNCTIONS
@@ -94,16 +374,11 @@ def get_tick_data(symbol: str) -> pd.DataFrame:
     logger.info(f"Loading tick data for {lib_symbol}")
     
     try:
-        df = arctic_lib.read(lib_symbol).data
+        df = _get_lib().read(lib_symbol, columns=TICK_COLUMNS).data
         
-        # Vectorized timestamp conversion
-        df["datetime"] = (
-            np.datetime64("1899-12-30")
-            + np.timedelta64(UTC_OFFSET_US, "us")
-            + df["timestamp"].astype("timedelta64[us]")
-        ).astype("datetime64[ns]")
-
-        df.set_index("datetime", inplace=True, drop=True)
+        # Vectorized timestamp conversion: one int64 multiply-add to epoch ns
+        ns = df["timestamp"].to_numpy(np.int64) * 1000 + _settings().epoch_ns
+        df.index = pd.DatetimeIndex(ns.view("datetime64[ns]"), name="datetime")
         
         logger.info(f"Successfully loaded {len(df)} ticks for {symbol}")
         return df
@@ -113,126 +388,110 @@ def get_tick_data(symbol: str) -> pd.DataFrame:
         raise
 
 def filter_session_hours(df: pd.DataFrame) -> pd.DataFrame:
-    """Vectorized session hours filtering."""
-    mask = (
-        (df.index.time >= SESSION_START) &
-        (df.index.time <= SESSION_END)
-    )
+    """Vectorized session hours filtering on int64 time-of-day nanoseconds."""
+    settings = _settings()
+    tod_ns = _index_ns(df) % DAY_NS
+    mask = (tod_ns >= settings.session_start_ns) & (tod_ns <= settings.session_end_ns)
     filtered_df = df[mask]
     logger.debug(f"Filtered {len(df)} rows to {len(filtered_df)} rows within session hours")
     return filtered_df
 
 def build_time_bars(df: pd.DataFrame, freq: str = '1Min') -> pd.DataFrame:
-    """Optimized time-based bar building using pure pandas operations."""
+    """
+    Optimized time-based bar building using numpy reduceat (or polars).
+    OHLC is float32, exact for quarter-point ticks (see OHLC_DTYPE).
+    """
     logger.info(f"Building {freq} time bars")
     
+    settings = _settings()
     df = filter_session_hours(df)
-    
-    if NEW_BAR_AT_SESSION_START:
-        # Handle session boundaries efficiently using groupby
-        grouped = df.groupby(pd.Grouper(freq=freq, offset=pd.Timedelta(
-            hours=SESSION_START.hour,
-            minutes=SESSION_START.minute,
-            seconds=SESSION_START.second
-        )))
+
+    if settings.new_bar_at_session_start:
+        offset = pd.Timedelta(
+            hours=settings.session_start.hour,
+            minutes=settings.session_start.minute,
+            seconds=settings.session_start.second
+        )
     else:
-        grouped = df.groupby(pd.Grouper(freq=freq))
-    
-    # Vectorized aggregation
-    ohlcv = grouped.agg({
-        'price': ['first', 'max', 'min', 'last'],
-        'qty': 'sum'
-    })
-    
-    ohlcv.columns = ['open', 'high', 'low', 'close', 'volume']
-    ohlcv.dropna(subset=['open'], inplace=True)
-    
+        offset = pd.Timedelta(0)
+
+    if _intraday_bin_ns(freq) is None:
+        ohlcv = _grouper_time_bars(df, freq, offset)
+    elif settings.use_polars and len(df):
+        ohlcv = _polars_time_bars(df, freq, offset)
+    else:
+        ohlcv = _reduce_time_bars(df, freq, offset)
+
     logger.info(f"Generated {len(ohlcv)} {freq} bars")
     return ohlcv
 
 def build_trade_bars(df: pd.DataFrame, trades_per_bar: int = 100) -> pd.DataFrame:
-    """Optimized trade-based bar building using numpy operations."""
+    """
+    Optimized trade-based bar building using numpy operations.
+    OHLC is float32, exact for quarter-point ticks (see OHLC_DTYPE).
+    """
     logger.info(f"Building trade bars with {trades_per_bar} trades per bar")
     
+    settings = _settings()
     df = filter_session_hours(df)
-    df = df.sort_index()
+    # SCID ticks arrive time-ordered; only pay for a sort when they are not
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind='stable')
     
     # Create bar IDs using integer division
     n_trades = len(df)
     base_bar_ids = np.arange(n_trades) // trades_per_bar
     
-    if NEW_BAR_AT_SESSION_START:
-        # Find session starts
-        session_starts = df.index.time == SESSION_START
-        # Increment bar IDs after session starts
-        bar_ids = base_bar_ids + np.cumsum(session_starts)
+    if settings.new_bar_at_session_start:
+        # Find session starts on int64 time-of-day, no per-row time objects
+        session_starts = (_index_ns(df) % DAY_NS) == settings.session_start_ns
+        # Increment bar IDs after session starts (int32 keeps the scan small)
+        bar_ids = base_bar_ids + np.cumsum(session_starts, dtype=np.int32)
     else:
         bar_ids = base_bar_ids
-    
+
     # Group and aggregate
-    grouped = df.groupby(bar_ids)
-    prices = grouped['price']
-    volumes = grouped['qty']
-    times = grouped.apply(lambda x: pd.Series({
-        'bar_time_first': x.index[0],
-        'bar_time_last': x.index[-1]
-    }))
-    
-    # Combine results
-    ohlcv = pd.DataFrame({
-        'open': prices.first(),
-        'high': prices.max(),
-        'low': prices.min(),
-        'close': prices.last(),
-        'volume': volumes.sum(),
-        'bar_time_first': times['bar_time_first'],
-        'bar_time_last': times['bar_time_last']
-    })
-    
+    if HAVE_NUMBA:
+        ohlcv = _kernel_bars(df, bar_ids)
+    else:
+        ohlcv = _reduce_bars(df, bar_ids)
+
     logger.info(f"Generated {len(ohlcv)} trade bars")
     return ohlcv
 
 def build_volume_bars(df: pd.DataFrame, volume_per_bar: int = 1000) -> pd.DataFrame:
-    """Optimized volume-based bar building using numpy operations."""
+    """
+    Optimized volume-based bar building using numpy operations.
+    OHLC is float32, exact for quarter-point ticks (see OHLC_DTYPE).
+    """
     logger.info(f"Building volume bars with {volume_per_bar} volume per bar")
     
+    settings = _settings()
     df = filter_session_hours(df)
-    df = df.sort_index()
-    
-    # Calculate cumulative volume
-    cumulative_volume = df['qty'].cumsum()
-    
+    # SCID ticks arrive time-ordered; only pay for a sort when they are not
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind='stable')
+
+    # Calculate cumulative volume (int64 so busy contracts cannot overflow)
+    cumulative_volume = np.cumsum(df['qty'].to_numpy(np.int64))
+
     # Create base bar IDs using volume threshold
     base_bar_ids = cumulative_volume // volume_per_bar
-    
-    if NEW_BAR_AT_SESSION_START:
-        # Find session starts
-        session_starts = df.index.time == SESSION_START
-        # Increment bar IDs after session starts
-        bar_ids = base_bar_ids + np.cumsum(session_starts)
+
+    if settings.new_bar_at_session_start:
+        # Find session starts on int64 time-of-day, no per-row time objects
+        session_starts = (_index_ns(df) % DAY_NS) == settings.session_start_ns
+        # Increment bar IDs after session starts (int32 keeps the scan small)
+        bar_ids = base_bar_ids + np.cumsum(session_starts, dtype=np.int32)
     else:
         bar_ids = base_bar_ids
-    
+
     # Group and aggregate
-    grouped = df.groupby(bar_ids)
-    prices = grouped['price']
-    volumes = grouped['qty']
-    times = grouped.apply(lambda x: pd.Series({
-        'bar_time_first': x.index[0],
-        'bar_time_last': x.index[-1]
-    }))
-    
-    # Combine results
-    ohlcv = pd.DataFrame({
-        'open': prices.first(),
-        'high': prices.max(),
-        'low': prices.min(),
-        'close': prices.last(),
-        'volume': volumes.sum(),
-        'bar_time_first': times['bar_time_first'],
-        'bar_time_last': times['bar_time_last']
-    })
-    
+    if HAVE_NUMBA:
+        ohlcv = _kernel_bars(df, bar_ids)
+    else:
+        ohlcv = _reduce_bars(df, bar_ids)
+
     logger.info(f"Generated {len(ohlcv)} volume bars")
     return ohlcv
 
@@ -240,12 +499,80 @@ def store_bars_arctic(symbol: str, df_bars: pd.DataFrame, suffix: str):
     """Store OHLCV bars in Arctic."""
     lib_symbol = f"{symbol}_bars_{suffix}"
     try:
-        arctic_lib.write(lib_symbol, df_bars)
+        _get_lib().write(lib_symbol, df_bars)
         logger.info(f"Successfully stored {len(df_bars)} bars to Arctic: {lib_symbol}")
     except Exception as e:
         logger.error(f"Failed to store bars to Arctic {lib_symbol}: {str(e)}")
         raise
 
+############
+# PARALLEL
+############
+
+def share_ticks(df: pd.DataFrame):
+    """
+    Copy the columns the bar builders need into shared memory blocks.
+    Returns (blocks, spec); spec is a picklable {column: (name, shape, dtype)}
+    for _build_bars_worker. The caller must close() and unlink() the blocks.
+    """
+    cols = {
+        'ns': _index_ns(df),
+        'price': df['price'].to_numpy(np.float64),
+        'qty': df['qty'].to_numpy(np.int64)
+    }
+    blocks = []
+    spec = {}
+    for key, arr in cols.items():
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+        blocks.append(shm)
+        spec[key] = (shm.name, arr.shape, arr.dtype.str)
+    return blocks, spec
+
+def _build_bars_worker(spec: dict, builder, kwargs: dict) -> pd.DataFrame:
+    """
+    Attach to the shared tick columns and run one bar builder over views of
+    them. Builder outputs never alias their input, so the views are dropped
+    before the blocks are closed.
+    """
+    shms = {key: shared_memory.SharedMemory(name=name) for key, (name, _, _) in spec.items()}
+    cols = df = None
+    try:
+        cols = {
+            key: np.ndarray(shape, dtype=dtype, buffer=shms[key].buf)
+            for key, (_, shape, dtype) in spec.items()
+        }
+        df = pd.DataFrame(
+            {'price': cols['price'], 'qty': cols['qty']},
+            index=pd.DatetimeIndex(cols['ns'].view('datetime64[ns]'), name='datetime', copy=False),
+            copy=False
+        )
+        return builder(df, **kwargs)
+    finally:
+        cols = df = None
+        for shm in shms.values():
+            shm.close()
+
+def build_bars_parallel(df: pd.DataFrame, jobs: dict) -> dict:
+    """
+    Run {label: (builder, kwargs)} bar jobs over the same ticks in separate
+    processes, sharing the tick columns instead of pickling them per job.
+    Workers are always spawned, as on Windows: forking after polars has
+    started its thread pool deadlocks the children.
+    """
+    blocks, spec = share_ticks(df)
+    try:
+        with ProcessPoolExecutor(max_workers=len(jobs), mp_context=get_context('spawn')) as ex:
+            futures = {
+                label: ex.submit(_build_bars_worker, spec, builder, kwargs)
+                for label, (builder, kwargs) in jobs.items()
+            }
+            return {label: fut.result() for label, fut in futures.items()}
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
 ############
 # MAIN
 ############
@@ -272,18 +599,19 @@ if __name__ == "__main__":
         logger.info(f"Starting bar generation for {symbol}")
 
         df_ticks = get_tick_data(symbol)
-        
-        # Build and display time bars
-        df_timebars = build_time_bars(df_ticks, freq='1Min')
-        display_bars(df_timebars, "Time (1-minute)")
-        
-        # Build and display trade bars
-        df_tradebars = build_trade_bars(df_ticks, trades_per_bar=375)
-        display_bars(df_tradebars, "Trade (375)")
-        
-        # Build and display volume bars
-        df_volbars = build_volume_bars(df_ticks, volume_per_bar=750)
-        display_bars(df_volbars, "Volume (750)")
+
+        # Build all three bar types concurrently over the same ticks
+        bars = build_bars_parallel(df_ticks, {
+            "Time (1-minute)": (build_time_bars, {'freq': '1Min'}),
+            "Trade (375)": (build_trade_bars, {'trades_per_bar': 375}),
+            "Volume (750)": (build_volume_bars, {'volume_per_bar': 750})
+        })
+        for bar_type, df_bars in bars.items():
+            display_bars(df_bars, bar_type)
+
+        df_timebars = bars["Time (1-minute)"]
+        df_tradebars = bars["Trade (375)"]
+        df_volbars = bars["Volume (750)"]
 
         logger.info("\n=== Bar Statistics ===")
         logger.info(f"Time bars: {len(df_timebars)} bars generated")
@@ -18,11 +18,14 @@ import sys
 import re
 import asyncio
 import time
+import numpy as np
 import pandas as pd
 
-from json import loads, dumps
-from os   import walk
-from re   import match
+from concurrent.futures import ProcessPoolExecutor
+from functools          import lru_cache
+from json               import loads, dumps
+from os                 import walk
+from re                 import match
 
 # ArcticDB v2
 from arcticdb import Arctic
@@ -43,99 +46,161 @@ SC_ROOT   = CONFIG["sc_root"]
 ARCTIC_HOST = "mongodb://localhost:27017"
 LIB_NAME    = "tick_data"
 
-# Create/connect to library
-store = Arctic(ARCTIC_HOST)
-if LIB_NAME not in store.list_libraries():
-    store.create_library(LIB_NAME)
-arctic_lib = store[LIB_NAME]
+@lru_cache(maxsize=1)
+def _get_lib():
+    """
+    Create/connect to library on first use. Parse workers import this
+    module too and must not open their own Mongo connections.
+    """
+    store = Arctic(ARCTIC_HOST)
+    if LIB_NAME not in store.list_libraries():
+        store.create_library(LIB_NAME)
+    return store[LIB_NAME]
+
+# Write batching thresholds
+BATCH_MAX_ROWS = 100_000
+BATCH_MAX_AGE  = 5.0  # seconds
 
 ###############
 # HELPER FUNCTIONS
 ###############
 
+class BatchedTickWriter:
+    """
+    Buffers DataFrames per Arctic symbol and writes them in one call once
+    BATCH_MAX_ROWS rows are pending or BATCH_MAX_AGE seconds have passed
+    since the last flush, instead of writing every small poll delta. The
+    first flush of a symbol writes it, later flushes append to it.
+    """
+
+    def __init__(self, get_lib, max_rows: int = BATCH_MAX_ROWS, max_age: float = BATCH_MAX_AGE):
+        self.get_lib    = get_lib
+        self.max_rows   = max_rows
+        self.max_age    = max_age
+        self.bufs       = {}
+        self.row_count  = {}
+        self.last_flush = {}
+        self.written    = set()
+
+    def add(self, lib_symbol: str, df: pd.DataFrame):
+        if not df.empty:
+            self.bufs.setdefault(lib_symbol, []).append(df)
+            self.row_count[lib_symbol] = self.row_count.get(lib_symbol, 0) + len(df)
+
+        last = self.last_flush.setdefault(lib_symbol, time.monotonic())
+        if self.row_count.get(lib_symbol, 0) >= self.max_rows or \
+           time.monotonic() - last > self.max_age:
+            self.flush(lib_symbol)
+
+    def flush(self, lib_symbol: str):
+        bufs = self.bufs.pop(lib_symbol, None)
+        self.row_count.pop(lib_symbol, None)
+        self.last_flush[lib_symbol] = time.monotonic()
+
+        if bufs:
+            df = bufs[0] if len(bufs) == 1 else pd.concat(bufs, ignore_index=True)
+            if lib_symbol in self.written:
+                self.get_lib().append(lib_symbol, df)
+            else:
+                # This overwrites existing data with a new version
+                self.get_lib().write(lib_symbol, df)
+                self.written.add(lib_symbol)
+
+    def flush_all(self):
+        for lib_symbol in list(self.bufs):
+            self.flush(lib_symbol)
+
+writer = BatchedTickWriter(_get_lib)
+
+def _sort_by_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Order rows by timestamp. Sierra Chart writes records in time order, so
+    the sort is skipped unless the column is actually out of order.
+    """
+    if df["timestamp"].is_monotonic_increasing:
+        return df
+    order = np.argsort(df["timestamp"].to_numpy(), kind="stable")
+    return df.iloc[order].reset_index(drop=True)
+
 def _records_to_df_tas(records):
     """
     Convert T&S records to a DataFrame with columns:
     timestamp, price, qty, side
     """
-    if not records:
+    if not len(records):
         return pd.DataFrame(columns=["timestamp", "price", "qty", "side"])
     df = pd.DataFrame(records, columns=["timestamp", "price", "qty", "side"])
-    df = df.sort_values("timestamp").reset_index(drop=True)
-    return df
+    return _sort_by_timestamp(df)
 
 def _records_to_df_depth(records):
     """
     Convert Depth records to a DataFrame with columns:
     timestamp, command, flags, num_orders, price, quantity
     """
-    if not records:
+    if not len(records):
         return pd.DataFrame(columns=["timestamp", "command", "flags", "num_orders", "price", "quantity"])
     df = pd.DataFrame(records, columns=["timestamp", "command", "flags", "num_orders", "price", "quantity"])
-    df = df.sort_values("timestamp").reset_index(drop=True)
-    return df
+    return _sort_by_timestamp(df)
 
 def write_tas_arctic(symbol_name: str, records: list):
     """
-    Write T&S records to Arctic under symbol: symbol_name + "_tas".
+    Queue T&S records for Arctic under symbol: symbol_name + "_tas".
     NOTE: ArcticDB (v2) does not have an 'upsert=True' parameter like old Arctic.
-          This will simply create a new version each time.
+          Each flush of the batched writer creates a new version.
     """
-    df = _records_to_df_tas(records)
-    if not df.empty:
-        lib_symbol = f"{symbol_name}_tas"
-        # This overwrites existing data with a new version
-        arctic_lib.write(lib_symbol, df)
+    writer.add(f"{symbol_name}_tas", _records_to_df_tas(records))
 
 def write_depth_arctic(symbol_name: str, records: list):
     """
-    Write Depth records to Arctic under symbol: symbol_name + "_depth".
+    Queue Depth records for Arctic under symbol: symbol_name + "_depth".
     """
-    df = _records_to_df_depth(records)
-    if not df.empty:
-        lib_symbol = f"{symbol_name}_depth"
-        # This overwrites existing data with a new version
-        arctic_lib.write(lib_symbol, df)
+    writer.add(f"{symbol_name}_depth", _records_to_df_depth(records))
 
 ################
 # TIME & SALES
 ################
 
+def parse_tas_file(fn: str, checkpoint: int, price_adj: float):
+    """
+    Worker-side step: parse and transform one .scid file from checkpoint.
+    Returns (records, new_checkpoint).
+    """
+    with open(fn, "rb") as fd:
+        parse_tas_header(fd)
+        parsed = transform_tas(parse_tas(fd, checkpoint), price_adj)
+
+    return parsed, checkpoint + len(parsed)
+
 async def etl_tas_coro(
+    pool: ProcessPoolExecutor,
     con_id: str,
     checkpoint: int,
     price_adj: float,
     loop_mode: int
 ):
     """
-    Parse SCID data from disk for one contract,
-    transform, then write to Arctic.
+    Parse SCID data from disk for one contract in a pool worker,
+    then queue the transformed records for Arctic.
     """
-    fn = f"{SC_ROOT}/Data/{con_id}.scid"
-    to_seek = checkpoint
+    fn   = f"{SC_ROOT}/Data/{con_id}.scid"
+    loop = asyncio.get_running_loop()
 
-    with open(fn, "rb") as fd:
-        parse_tas_header(fd)
+    while True:
+        parsed, checkpoint = await loop.run_in_executor(
+            pool, parse_tas_file, fn, checkpoint, price_adj
+        )
 
-        while True:
-            parsed = parse_tas(fd, to_seek)
-            parsed = transform_tas(parsed, price_adj)
+        # Write to Arctic
+        write_tas_arctic(con_id, parsed)
 
-            # Write to Arctic
-            write_tas_arctic(con_id, parsed)
-
-            # Update checkpoint
-            checkpoint += len(parsed)
-            to_seek = 0
-
-            if loop_mode:
-                await asyncio.sleep(SLEEP_INT)
-            else:
-                break
+        if loop_mode:
+            await asyncio.sleep(SLEEP_INT)
+        else:
+            break
 
     return (con_id, checkpoint)
 
-async def etl_tas(loop_mode: int):
+async def etl_tas(pool: ProcessPoolExecutor, loop_mode: int):
     """
     Orchestrate T&S ETL for all configured contracts.
     """
@@ -144,7 +209,7 @@ async def etl_tas(loop_mode: int):
         if info.get("tas", False):
             checkpoint = info["checkpoint_tas"]
             price_adj  = info["price_adj"]
-            coros.append(etl_tas_coro(con_id, checkpoint, price_adj, loop_mode))
+            coros.append(etl_tas_coro(pool, con_id, checkpoint, price_adj, loop_mode))
 
     results = await asyncio.gather(*coros)
     for con_id, new_cp in results:
@@ -154,45 +219,47 @@ async def etl_tas(loop_mode: int):
 # MARKET DEPTH
 ##############
 
+def parse_depth_file(fn: str, checkpoint: int, price_adj: float):
+    """
+    Worker-side step: parse and transform one .depth file from checkpoint.
+    Returns (records, new_checkpoint).
+    """
+    with open(fn, "rb") as fd:
+        parse_depth_header(fd)
+        parsed = transform_depth(parse_depth(fd, checkpoint), price_adj)
+
+    return parsed, checkpoint + len(parsed)
+
 async def etl_depth_coro(
+    pool: ProcessPoolExecutor,
     con_id: str,
     file_name: str,
     checkpoint: int,
-    price_adj: float,
-    loop_mode: int
+    price_adj: float
 ):
     """
-    Parse .depth data from disk for one day (one file),
-    transform, then write to Arctic.
+    Loop mode: poll the most recent .depth file in a pool worker every
+    SLEEP_INT seconds and queue the records added since checkpoint.
     """
-    fn = f"{SC_ROOT}/Data/MarketDepthData/{file_name}"
-    to_seek = checkpoint
-
-    with open(fn, "rb") as fd:
-        parse_depth_header(fd)
-
-        while True:
-            parsed = parse_depth(fd, to_seek)
-            parsed = transform_depth(parsed, price_adj)
+    fn   = f"{SC_ROOT}/Data/MarketDepthData/{file_name}"
+    loop = asyncio.get_running_loop()
 
-            # Write to Arctic
-            write_depth_arctic(con_id, parsed)
-
-            checkpoint += len(parsed)
-            to_seek = 0
+    while True:
+        await asyncio.sleep(SLEEP_INT)
 
-            if loop_mode:
-                await asyncio.sleep(SLEEP_INT)
-            else:
-                break
+        parsed, checkpoint = await loop.run_in_executor(
+            pool, parse_depth_file, fn, checkpoint, price_adj
+        )
 
-    return (file_name, checkpoint)
+        # Write to Arctic
+        write_depth_arctic(con_id, parsed)
 
-async def etl_depth(loop_mode: int):
+async def etl_depth(pool: ProcessPoolExecutor, loop_mode: int):
     """
     Orchestrate depth ETL for all configured contracts.
     """
     _, _, files = next(walk(f"{SC_ROOT}/Data/MarketDepthData"))
+    loop = asyncio.get_running_loop()
 
     for con_id, info in CONTRACTS.items():
         if not info.get("depth", False):
@@ -213,23 +280,28 @@ async def etl_depth(loop_mode: int):
         if not to_parse:
             continue
 
-        coros = []
+        parses = []
         for depth_file in to_parse:
             # checkpoint applies only to the earliest file
             cp = checkpoint_rec if checkpoint_date in depth_file else 0
-            # loop_mode applies only to the last (most recent) file
-            mod = loop_mode if depth_file == to_parse[-1] else 0
+            fn = f"{SC_ROOT}/Data/MarketDepthData/{depth_file}"
+            parses.append(loop.run_in_executor(pool, parse_depth_file, fn, cp, price_adj))
 
-            coros.append(etl_depth_coro(con_id, depth_file, cp, price_adj, mod))
+        # Files are parsed concurrently but queued in file (date) order,
+        # so the stored symbol stays in time order
+        for parse in parses:
+            parsed, last_checkpoint = await parse
+            write_depth_arctic(con_id, parsed)
 
-        results = await asyncio.gather(*coros)
+        # loop_mode applies only to the last (most recent) file
+        last_file = to_parse[-1]
+        if loop_mode:
+            await etl_depth_coro(pool, con_id, last_file, last_checkpoint, price_adj)
 
-        # The last result => the final checkpoint
-        if results:
-            last_file, last_checkpoint = results[-1]
-            new_date = last_file.split(".")[1]
-            CONFIG["contracts"][con_id]["checkpoint_depth"]["date"] = new_date
-            CONFIG["contracts"][con_id]["checkpoint_depth"]["rec"] = last_checkpoint
+        # The last file => the final checkpoint
+        new_date = last_file.split(".")[1]
+        CONFIG["contracts"][con_id]["checkpoint_depth"]["date"] = new_date
+        CONFIG["contracts"][con_id]["checkpoint_depth"]["rec"] = last_checkpoint
 
 ###########
 # MAIN
@@ -240,10 +312,15 @@ async def main():
 
     loop_mode = int(sys.argv[1]) if len(sys.argv) > 1 else 0
 
-    # Run T&S and Depth ETLs concurrently
-    task_tas   = etl_tas(loop_mode)
-    task_depth = etl_depth(loop_mode)
-    await asyncio.gather(task_tas, task_depth)
+    # Run T&S and Depth ETLs concurrently; parsing is CPU-bound, so
+    # each file is parsed in a separate worker process
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        task_tas   = etl_tas(pool, loop_mode)
+        task_depth = etl_depth(pool, loop_mode)
+        await asyncio.gather(task_tas, task_depth)
+
+    # Flush any buffered records before committing checkpoints
+    writer.flush_all()
 
     # Write updated checkpoints to config
     with open("./config.json", "w") as fd:
@@ -6,10 +6,11 @@ Contains parsing logic for Sierra Chart .scid (Time & Sales) and
 .depth (Market Depth) files. Also includes basic transformations.
 """
 from enum        import IntEnum
-from numpy       import datetime64
+from mmap        import mmap, ACCESS_READ
+from numpy       import copyto, datetime64, dtype, empty, frombuffer, logical_not, ndarray
 from os          import fstat
 from struct      import calcsize, Struct
-from typing      import BinaryIO, List
+from typing      import BinaryIO
 
 SC_EPOCH = datetime64("1899-12-30")
 
@@ -34,60 +35,86 @@ class tas_rec(IntEnum):
 # Binary formats from Sierra Chart docs
 INTRADAY_HEADER_FMT  = "4cIIHHI36c"
 INTRADAY_HEADER_LEN  = calcsize(INTRADAY_HEADER_FMT)
+INTRADAY_HEADER_UNPACK = Struct(INTRADAY_HEADER_FMT).unpack_from
 
 INTRADAY_REC_FMT     = "q4f4I"
 INTRADAY_REC_LEN     = calcsize(INTRADAY_REC_FMT)
 INTRADAY_REC_UNPACK  = Struct(INTRADAY_REC_FMT).unpack_from
 
+# NumPy views of the same layouts, field names follow the enums above
+INTRADAY_DTYPE = dtype([
+    ("timestamp",   "<i8"),
+    ("open",        "<f4"),
+    ("high",        "<f4"),
+    ("low",         "<f4"),
+    ("close",       "<f4"),
+    ("num_trades",  "<u4"),
+    ("total_vol",   "<u4"),
+    ("bid_vol",     "<u4"),
+    ("ask_vol",     "<u4")
+])
+
+TAS_DTYPE = dtype([
+    ("timestamp",   "<i8"),
+    ("price",       "<f8"),
+    ("qty",         "<i8"),
+    ("side",        "<u1")
+])
+
+def _read_recs(fd: BinaryIO, rec_dtype: dtype) -> ndarray:
+    """
+    Memory-map fd and return a read-only, zero-copy structured array view
+    of all complete records from its current position. A trailing partial
+    record (still being written by Sierra Chart) is left for the next call.
+    """
+    pos = fd.tell()
+    n   = (fstat(fd.fileno()).st_size - pos) // rec_dtype.itemsize
+
+    if n <= 0:
+        return empty(0, dtype=rec_dtype)
+
+    mm = mmap(fd.fileno(), 0, access=ACCESS_READ)
+    fd.seek(pos + n * rec_dtype.itemsize)
+
+    return frombuffer(mm, dtype=rec_dtype, count=n, offset=pos)
+
 def parse_tas_header(fd: BinaryIO) -> tuple:
     header_bytes = fd.read(INTRADAY_HEADER_LEN)
-    header = Struct(INTRADAY_HEADER_FMT).unpack_from(header_bytes)
+    header = INTRADAY_HEADER_UNPACK(header_bytes)
     return header
 
-def parse_tas(fd: BinaryIO, checkpoint: int) -> List:
+def parse_tas(fd: BinaryIO, checkpoint: int) -> ndarray:
     """
-    Parse tick-by-tick records from .scid file. Each returned
-    record is (timestamp, price, quantity, side).
+    Parse tick-by-tick records from .scid file into a TAS_DTYPE
+    structured array of (timestamp, price, qty, side).
     side=0 => trade at bid, side=1 => trade at ask.
     """
-    fstat(fd.fileno())  # not strictly necessary, but can be used to get file size
-    tas_recs = []
-
     if checkpoint:
         fd.seek(INTRADAY_HEADER_LEN + checkpoint * INTRADAY_REC_LEN)
 
-    while intraday_rec_bytes := fd.read(INTRADAY_REC_LEN):
-        ir = INTRADAY_REC_UNPACK(intraday_rec_bytes)
-
-        # In T&S mode, "close" is the actual trade price,
-        # and "bid_vol"/"ask_vol" indicates side and quantity
-        trade_side = 0 if ir[intraday_rec.bid_vol] > 0 else 1
-        trade_qty  = ir[intraday_rec.bid_vol] if ir[intraday_rec.bid_vol] else ir[intraday_rec.ask_vol]
+    ir      = _read_recs(fd, INTRADAY_DTYPE)
+    bid_vol = ir["bid_vol"]
+    at_bid  = bid_vol > 0
 
-        rec = (
-            ir[intraday_rec.timestamp],
-            ir[intraday_rec.close],
-            trade_qty,
-            trade_side
-        )
-        tas_recs.append(rec)
+    # In T&S mode, "close" is the actual trade price,
+    # and "bid_vol"/"ask_vol" indicates side and quantity.
+    # Fields are written straight into the preallocated output.
+    tas_recs = empty(len(ir), dtype=TAS_DTYPE)
+    tas_recs["timestamp"] = ir["timestamp"]
+    tas_recs["price"]     = ir["close"]
+    tas_recs["qty"]       = ir["ask_vol"]
+    copyto(tas_recs["qty"], bid_vol, where=at_bid)
+    logical_not(at_bid, out=tas_recs["side"])
 
     return tas_recs
 
-def transform_tas(rs: List, price_adj: float):
+def transform_tas(rs: ndarray, price_adj: float) -> ndarray:
     """
-    Adjust raw trades, applying price multiplier (if needed).
-    Return a list of (timestamp, price, qty, side).
+    Adjust raw trades in place, applying price multiplier (if needed).
+    Return the same array of (timestamp, price, qty, side).
     """
-    return [
-        (
-            r[tas_rec.timestamp],
-            r[tas_rec.price] * price_adj,
-            r[tas_rec.qty],
-            r[tas_rec.side]
-        )
-        for r in rs
-    ]
+    rs["price"] *= price_adj
+    return rs
 
 # Market Depth
 class depth_rec(IntEnum):
@@ -111,47 +138,56 @@ class depth_cmd(IntEnum):
 
 DEPTH_HEADER_FMT  = "4I48c"
 DEPTH_HEADER_LEN  = calcsize(DEPTH_HEADER_FMT)
+DEPTH_HEADER_UNPACK = Struct(DEPTH_HEADER_FMT).unpack_from
 
 DEPTH_REC_FMT     = "qBBHfII"
 DEPTH_REC_LEN     = calcsize(DEPTH_REC_FMT)
 DEPTH_REC_UNPACK  = Struct(DEPTH_REC_FMT).unpack_from
 
+DEPTH_DTYPE = dtype([
+    ("timestamp",   "<i8"),
+    ("command",     "<u1"),
+    ("flags",       "<u1"),
+    ("num_orders",  "<u2"),
+    ("price",       "<f4"),
+    ("quantity",    "<u4"),
+    ("reserved",    "<u4")
+])
+
+# transform_depth output: reserved dropped, price widened for adjustment
+DEPTH_OUT_DTYPE = dtype([
+    ("timestamp",   "<i8"),
+    ("command",     "<u1"),
+    ("flags",       "<u1"),
+    ("num_orders",  "<u2"),
+    ("price",       "<f8"),
+    ("quantity",    "<u4")
+])
+
 def parse_depth_header(fd: BinaryIO) -> tuple:
     header_bytes = fd.read(DEPTH_HEADER_LEN)
-    header = Struct(DEPTH_HEADER_FMT).unpack_from(header_bytes)
+    header = DEPTH_HEADER_UNPACK(header_bytes)
     return header
 
-def parse_depth(fd: BinaryIO, checkpoint: int) -> List:
+def parse_depth(fd: BinaryIO, checkpoint: int) -> ndarray:
     """
-    Parse market depth records from .depth file into a list of tuples:
-    (timestamp, command, flags, num_orders, price, quantity).
+    Parse market depth records from .depth file into a DEPTH_DTYPE
+    structured array of:
+    (timestamp, command, flags, num_orders, price, quantity, reserved).
     """
-    fstat(fd.fileno())
-    depth_recs = []
-
     if checkpoint:
         fd.seek(DEPTH_HEADER_LEN + checkpoint * DEPTH_REC_LEN)
 
-    while depth_rec_bytes := fd.read(DEPTH_REC_LEN):
-        dr = DEPTH_REC_UNPACK(depth_rec_bytes)
-        depth_recs.append(dr)
-
-    return depth_recs
+    return _read_recs(fd, DEPTH_DTYPE)
 
-def transform_depth(rs: List, price_adj: float):
+def transform_depth(rs: ndarray, price_adj: float) -> ndarray:
     """
     Adjust prices by multiplier, remove the 'reserved' field,
-    and return a list of:
+    and return a DEPTH_OUT_DTYPE array of:
     (timestamp, command, flags, num_orders, price, quantity)
     """
-    return [
-        (
-            r[depth_rec.timestamp],
-            r[depth_rec.command],
-            r[depth_rec.flags],
-            r[depth_rec.num_orders],
-            r[depth_rec.price] * price_adj,
-            r[depth_rec.quantity]
-        )
-        for r in rs
-    ]
+    out = empty(len(rs), dtype=DEPTH_OUT_DTYPE)
+    for name in DEPTH_OUT_DTYPE.names:
+        out[name] = rs[name]
+    out["price"] *= price_adj
+    return out
@@ -7,14 +7,33 @@ to FLAG_END_OF_BATCH) that ends at or before a user-specified
 target timestamp (Sierra Chart microseconds).
 """
 
+import numpy as np
 import pandas as pd
-from arcticdb import Arctic
-from typing import Dict, List, Tuple, Optional
+from arcticdb import Arctic, QueryBuilder
+from typing import List, NamedTuple, Tuple, Optional
 import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda f: f
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# ArcticDB setup
+ARCTIC_HOST  = "mongodb://localhost:27017"
+LIB_NAME     = "tick_data"
+DEPTH_SYMBOL = "NQH25_FUT_CME_depth"
+
 # Sierra Chart Depth Command Enums
 CMD_CLEAR_BOOK       = 1
 CMD_ADD_BID_LEVEL    = 2
@@ -27,129 +46,461 @@ CMD_DELETE_ASK_LEVEL = 7
 # Flag
 FLAG_END_OF_BATCH = 0x01
 
-def apply_depth_update(bids: Dict[float, Tuple[int, int]], 
-                      asks: Dict[float, Tuple[int, int]], 
-                      row: pd.Series,
-                      validate: bool = True) -> None:
+# Columns the snapshot search and replay read, and their narrowest lossless
+# dtypes (the field widths of a .depth record, price after adjustment)
+DEPTH_COLUMNS = ['command', 'price', 'quantity', 'num_orders', 'flags', 'timestamp']
+DEPTH_DTYPES  = {
+    'command':    'uint8',
+    'flags':      'uint8',
+    'num_orders': 'uint16',
+    'quantity':   'uint32',
+    'timestamp':  'int64',
+    'price':      'float64',
+}
+
+# Command membership tables, indexed by (valid) command
+_IS_BID_WRITE  = np.zeros(8, dtype=bool)
+_IS_ASK_WRITE  = np.zeros(8, dtype=bool)
+_IS_BID_DELETE = np.zeros(8, dtype=bool)
+_IS_ASK_DELETE = np.zeros(8, dtype=bool)
+_IS_BID_WRITE[[CMD_ADD_BID_LEVEL, CMD_MODIFY_BID_LEVEL]] = True
+_IS_ASK_WRITE[[CMD_ADD_ASK_LEVEL, CMD_MODIFY_ASK_LEVEL]] = True
+_IS_BID_DELETE[CMD_DELETE_BID_LEVEL] = True
+_IS_ASK_DELETE[CMD_DELETE_ASK_LEVEL] = True
+
+# Level side codes used by the replay kernel
+SIDE_NONE = 0
+SIDE_BID  = 1
+SIDE_ASK  = 2
+
+class BookLevels(NamedTuple):
     """
-    Applies one market depth command to the current order book state in-place.
-    Args:
-        bids: Dict mapping price -> (quantity, num_orders) for bid side
-        asks: Dict mapping price -> (quantity, num_orders) for ask side
-        row: DataFrame row with command, price, quantity, num_orders
-        validate: Whether to validate inputs
+    Array form of a book: one entry per known price (sorted ascending)
+    with the side it currently rests on (SIDE_*) and its qty/num_orders,
+    plus the index of the best bid/ask level (-1 if that side is empty).
     """
-    try:
-        cmd = int(row['command'])
-        price = float(row['price'])
-        quantity = int(row['quantity'])
-        num_orders = int(row['num_orders'])
-        
-        # Validation checks
-        if validate:
-            if cmd not in range(1, 8):
-                logger.warning(f"Invalid command: {cmd}")
-                return
-            if cmd != CMD_CLEAR_BOOK and (price <= 0 or quantity < 0 or num_orders < 0):
-                logger.warning(f"Invalid price/quantity/orders: {price}/{quantity}/{num_orders}")
-                return
-
-        if cmd == CMD_CLEAR_BOOK:
-            bids.clear()
-            asks.clear()
-            return
-
-        # Determine if it's a bid or ask using command number (even=bid, odd=ask)
-        is_bid = (cmd % 2) == 0
-        
-        # For modifications/adds
-        if cmd in (CMD_ADD_BID_LEVEL, CMD_MODIFY_BID_LEVEL) and is_bid:
-            if price in asks:  # Remove from wrong side if present
-                del asks[price]
-            bids[price] = (quantity, num_orders)
-        elif cmd in (CMD_ADD_ASK_LEVEL, CMD_MODIFY_ASK_LEVEL) and not is_bid:
-            if price in bids:  # Remove from wrong side if present
-                del bids[price]
-            asks[price] = (quantity, num_orders)
-        # Handle deletes
-        elif cmd == CMD_DELETE_BID_LEVEL and is_bid and price in bids:
-            del bids[price]
-        elif cmd == CMD_DELETE_ASK_LEVEL and not is_bid and price in asks:
-            del asks[price]
-            
-    except (ValueError, KeyError, TypeError) as e:
-        logger.warning(f"Error processing depth update: {e}")
-        return
+    prices:   np.ndarray
+    side:     np.ndarray
+    qty:      np.ndarray
+    orders:   np.ndarray
+    best_bid: int
+    best_ask: int
+
+EMPTY_LEVELS = BookLevels(
+    np.empty(0, np.float64), np.empty(0, np.int8), np.empty(0, np.int64), np.empty(0, np.int64), -1, -1
+)
+
+@njit(cache=True)
+def _replay_kernel(cmd, level, price, qty, nord, side, lq, lo, best):
+    """
+    Applies depth rows in order: CLEAR_BOOK empties the book, adds and
+    modifies set a level on their side (moving it off the other side),
+    deletes remove it, and rows with invalid commands or negative values
+    are skipped. Levels are addressed by `level`, a dense code per
+    distinct price, so each side is a fixed-size array instead of a dict.
+    Updates the per-level (side, quantity, num_orders) arrays in place.
+
+    best = [bid, ask] level indices. On entry they only need to bound the
+    book (no bid above best[0], no ask below best[1], which is len(side)
+    for no asks); writes keep them bounding, and they are resolved to the
+    actual best levels at the end by scanning inward from the bounds.
+    """
+    bb, ba = best[0], best[1]
+    for i in range(cmd.shape[0]):
+        c = cmd[i]
+        if c < CMD_CLEAR_BOOK or c > CMD_DELETE_ASK_LEVEL:
+            continue
+        if c == CMD_CLEAR_BOOK:
+            side[:] = SIDE_NONE
+            bb, ba = -1, side.shape[0]
+            continue
+        if price[i] <= 0 or qty[i] < 0 or nord[i] < 0:
+            continue
+
+        k = level[i]
+        if c == CMD_ADD_BID_LEVEL or c == CMD_MODIFY_BID_LEVEL:
+            side[k] = SIDE_BID
+            lq[k] = qty[i]
+            lo[k] = nord[i]
+            bb = max(bb, k)
+        elif c == CMD_ADD_ASK_LEVEL or c == CMD_MODIFY_ASK_LEVEL:
+            side[k] = SIDE_ASK
+            lq[k] = qty[i]
+            lo[k] = nord[i]
+            ba = min(ba, k)
+        elif c == CMD_DELETE_BID_LEVEL:
+            if side[k] == SIDE_BID:
+                side[k] = SIDE_NONE
+        elif side[k] == SIDE_ASK:
+            side[k] = SIDE_NONE
+
+    while bb >= 0 and side[bb] != SIDE_BID:
+        bb -= 1
+    while ba < side.shape[0] and side[ba] != SIDE_ASK:
+        ba += 1
+    best[0], best[1] = bb, ba
+
+
+def _replay_vectorized(cmd, level, price, qty, nord, side, lq, lo, best):
+    """
+    Vectorized equivalent of _replay_kernel() for when numba is missing.
+    The final state of a level only depends on the last bid/ask write
+    (add or modify) and the last bid/ask delete after the last CLEAR_BOOK:
+    a bid survives if its last bid write is newer than both the last ask
+    write (which moves the level) and the last bid delete, likewise for asks.
+    The incoming state counts as a write at position -1 (none is -2).
+    """
+    pos = np.arange(len(cmd))
+    valid = (cmd >= CMD_CLEAR_BOOK) & (cmd <= CMD_DELETE_ASK_LEVEL)
+    valid &= (cmd == CMD_CLEAR_BOOK) | ~((price <= 0) | (qty < 0) | (nord < 0))
+    clears = np.flatnonzero(valid & (cmd == CMD_CLEAR_BOOK))
+    if len(clears):
+        valid[:clears[-1] + 1] = False
+        side[:] = SIDE_NONE
+    cmd = np.where(valid, cmd, 0)  # in range for the lookup tables
+
+    def last_pos(is_cmd, initial_side=SIDE_NONE):
+        mask = is_cmd[cmd]
+        out = np.where((side == initial_side) & (side != SIDE_NONE), -1, -2)
+        np.maximum.at(out, level[mask], pos[mask])
+        return out
+
+    lbw = last_pos(_IS_BID_WRITE, SIDE_BID)
+    law = last_pos(_IS_ASK_WRITE, SIDE_ASK)
+    lbd = last_pos(_IS_BID_DELETE)
+    lad = last_pos(_IS_ASK_DELETE)
+
+    bid = lbw > np.maximum(law, lbd)
+    ask = law > np.maximum(lbw, lad)
+    src = np.where(bid, lbw, law)
+    new = (bid | ask) & (src >= 0)
+
+    side[:] = SIDE_NONE
+    side[bid] = SIDE_BID
+    side[ask] = SIDE_ASK
+    lq[new] = qty[src[new]]
+    lo[new] = nord[src[new]]
+
+    bids, asks = np.flatnonzero(bid), np.flatnonzero(ask)
+    best[0] = bids[-1] if len(bids) else -1
+    best[1] = asks[0] if len(asks) else len(side)
+
+
+def advance_levels(levels: BookLevels, cmd: np.ndarray, price: np.ndarray,
+                   qty: np.ndarray, nord: np.ndarray) -> BookLevels:
+    """
+    Applies depth rows (in order, given as command/price/quantity/
+    num_orders column arrays) on top of `levels` and returns the new
+    levels; `levels` itself is left untouched. Uses the compiled kernel
+    when numba is available, otherwise the vectorized replay.
+    """
+    price = price.astype(np.float64, copy=False)
+    prices, inverse = np.unique(np.concatenate((levels.prices, price)), return_inverse=True)
+    old, level = inverse[:len(levels.prices)], inverse[len(levels.prices):]
+
+    side = np.zeros(len(prices), np.int8)
+    lq = np.zeros(len(prices), np.int64)
+    lo = np.zeros(len(prices), np.int64)
+    side[old] = levels.side
+    lq[old] = levels.qty
+    lo[old] = levels.orders
+    best = np.array([
+        old[levels.best_bid] if levels.best_bid >= 0 else -1,
+        old[levels.best_ask] if levels.best_ask >= 0 else len(prices),
+    ], np.int64)
+
+    replay = _replay_kernel if HAVE_NUMBA else _replay_vectorized
+    replay(cmd, level, price, qty, nord, side, lq, lo, best)
+
+    best_bid, best_ask = int(best[0]), int(best[1])
+    return BookLevels(prices, side, lq, lo, best_bid, best_ask if best_ask < len(prices) else -1)
 
 
-def find_completed_snapshots(df_depth: pd.DataFrame) -> List[Tuple[int, int, int, int]]:
+class BookSide(NamedTuple):
     """
-    Identifies fully completed depth snapshots in the data.
-    Returns: List of tuples (start_idx, end_idx, start_ts, end_ts) for each snapshot
+    One side of a book as parallel arrays sorted by ascending price.
     """
-    snapshots = []
-    snapshot_start_idx = None
-    snapshot_start_ts = None
+    prices: np.ndarray
+    qty:    np.ndarray
+    orders: np.ndarray
+
+    def top(self, k: int, highest: bool) -> List[Tuple[float, int, int]]:
+        """
+        Best k levels as (price, qty, num_orders), best first. The arrays are
+        already price-sorted, so this is a slice rather than a sort.
+        """
+        n = len(self.prices)
+        k = max(0, min(k, n))
+        sel = slice(n - 1, n - k - 1 if n > k else None, -1) if highest else slice(0, k)
+        return list(zip(self.prices[sel].tolist(), self.qty[sel].tolist(), self.orders[sel].tolist()))
 
-    for idx, row in df_depth.iterrows():
-        try:
-            cmd = int(row['command'])
-            flg = int(row['flags'])
-            ts = int(row['timestamp'])
-
-            # Start new snapshot on CLEAR_BOOK
-            if cmd == CMD_CLEAR_BOOK:
-                snapshot_start_idx = idx
-                snapshot_start_ts = ts
-            
-            # End snapshot when we see END_OF_BATCH flag
-            if snapshot_start_idx is not None and (flg & FLAG_END_OF_BATCH) != 0:
-                snapshot_end_idx = idx
-                snapshot_end_ts = ts
-                snapshots.append((snapshot_start_idx, snapshot_end_idx, snapshot_start_ts, snapshot_end_ts))
-                # Don't reset start idx/ts here - allow for overlapping snapshots
-                # Only reset on next CLEAR_BOOK
-                
-        except (ValueError, KeyError, TypeError) as e:
-            logger.warning(f"Error processing row {idx}: {e}")
-            continue
 
-    return snapshots
+def _book_side(levels: BookLevels, mask: np.ndarray) -> BookSide:
+    return BookSide(levels.prices[mask], levels.qty[mask], levels.orders[mask])
 
 
-def validate_book_state(bids: Dict[float, Tuple[int, int]], 
-                     asks: Dict[float, Tuple[int, int]]) -> bool:
+def book_sides(levels: BookLevels) -> Tuple[BookSide, BookSide]:
     """
-    Validates that the order book state is consistent:
-    - All bid prices should be less than all ask prices
-    - No negative quantities or number of orders
+    Splits BookLevels into its (bids, asks) BookSides.
+    """
+    return (_book_side(levels, levels.side == SIDE_BID),
+            _book_side(levels, levels.side == SIDE_ASK))
+
+
+def _check_spread(max_bid: float, min_ask: float) -> bool:
+    """
+    Checks that the best bid is below the best ask, logging a warning if not.
     """
-    if not bids or not asks:
-        return True  # Empty or one-sided book is valid
-        
-    max_bid = max(bids.keys()) if bids else float('-inf')
-    min_ask = min(asks.keys()) if asks else float('inf')
-    
     if max_bid >= min_ask:
         logger.warning(f"Book validation failed: max_bid ({max_bid}) >= min_ask ({min_ask})")
         return False
-        
     return True
 
 
+def validate_book_levels(levels: BookLevels) -> bool:
+    """
+    Validates BookLevels in O(1) from the tracked best levels.
+    """
+    if levels.best_bid < 0 or levels.best_ask < 0:
+        return True  # Empty or one-sided book is valid
+    return _check_spread(levels.prices[levels.best_bid], levels.prices[levels.best_ask])
+
+
+def validate_book_sides(bids: BookSide, asks: BookSide) -> bool:
+    """
+    Validates BookSides: the best prices are the array ends.
+    """
+    if not len(bids.prices) or not len(asks.prices):
+        return True  # Empty or one-sided book is valid
+    return _check_spread(bids.prices[-1], asks.prices[0])
+
+
+def _validate_schema(df_depth: pd.DataFrame) -> None:
+    """
+    Checks once that df_depth has numeric DEPTH_COLUMNS, so the vectorized
+    scans and the replay need no per-row error handling. Rows with invalid
+    commands or values are skipped by the replay itself.
+    """
+    missing = [col for col in DEPTH_COLUMNS if col not in df_depth.columns]
+    if missing:
+        raise ValueError(f"Depth data is missing columns: {missing}")
+
+    bad = [col for col in DEPTH_COLUMNS if not pd.api.types.is_numeric_dtype(df_depth[col])]
+    if bad:
+        raise ValueError(f"Depth data has non-numeric columns: {bad}")
+
+
+def _snapshot_positions(df_depth: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns row positions (start_pos, end_pos) of every completed snapshot.
+    """
+    # Both fields are single bytes in the .depth format; these are
+    # zero-copy views unless the frame was upcast (e.g. astype(int))
+    cmd = df_depth['command'].to_numpy(np.uint8)
+    flg = df_depth['flags'].to_numpy(np.uint8)
+
+    start_pos = np.flatnonzero(cmd == CMD_CLEAR_BOOK)
+    end_pos   = np.flatnonzero((flg & FLAG_END_OF_BATCH) != 0)
+
+    # Pair every END_OF_BATCH row with the latest CLEAR_BOOK at or before it.
+    # Starts are not reset on an end, so several snapshots can share a start
+    # (overlapping snapshots); ends before the first CLEAR_BOOK are dropped.
+    owner = np.searchsorted(start_pos, end_pos, side='right') - 1
+    keep = owner >= 0
+    return start_pos[owner[keep]], end_pos[keep]
+
+
+def _last_snapshot_positions(df_depth: pd.DataFrame, target_ts: int) -> Optional[Tuple[int, int]]:
+    """
+    Row positions (start_pos, end_pos) of the last snapshot ending at or
+    before target_ts, or None. Sierra Chart writes depth in time order, so
+    for sorted timestamps only the rows up to target_ts are scanned for
+    snapshots; otherwise the whole frame is.
+    """
+    ts = df_depth['timestamp'].to_numpy(np.int64)
+    if df_depth['timestamp'].is_monotonic_increasing:
+        df_depth = df_depth.iloc[:np.searchsorted(ts, target_ts, side='right')]
+
+    start_pos, end_pos = _snapshot_positions(df_depth)
+    end_ts = ts[end_pos]
+    ok = np.flatnonzero(end_ts <= target_ts)
+    if not len(ok):
+        return None
+
+    # Latest end wins; on equal timestamps the first one, as in DepthReplayer
+    j = ok[np.argmax(end_ts[ok])]
+    return int(start_pos[j]), int(end_pos[j])
+
+
+def _top_of_book(
+    levels: BookLevels,
+    end_ts: int,
+    max_depth: int,
+    strict: bool = False
+) -> Tuple[Optional[int], List[Tuple[float, int, int]], List[Tuple[float, int, int]]]:
+    """
+    Returns (end_ts, bids_top, asks_top) for a replayed book. With strict,
+    the book is validated first and crossed levels are cleaned up, giving
+    (None, [], []) if it stays invalid; otherwise it is returned as replayed
+    and a crossed book is only reported when debug logging is enabled.
+    """
+    bids, asks = book_sides(levels)
+
+    if not strict:
+        if logger.isEnabledFor(logging.DEBUG):
+            validate_book_levels(levels)
+        return end_ts, bids.top(max_depth, highest=True), asks.top(max_depth, highest=False)
+
+    # Validate the book state
+    if not validate_book_levels(levels):
+        logger.warning(f"Invalid book state detected, attempting cleanup...")
+        
+        # Find the boundary between valid bids and asks
+        live = levels.side != SIDE_NONE
+        all_prices = levels.prices[live]
+        if len(all_prices) > 1:
+            mid_price = (all_prices[0] + all_prices[-1]) / 2
+            # Move misplaced orders to correct side: everything below
+            # the midpoint is a bid, everything at or above an ask
+            below = levels.prices < mid_price
+            bids = _book_side(levels, live & below)
+            asks = _book_side(levels, live & ~below)
+
+    logger.debug(f"Reconstructed book with {len(bids.prices)} bids and {len(asks.prices)} asks")
+    
+    if validate_book_sides(bids, asks):
+        return end_ts, bids.top(max_depth, highest=True), asks.top(max_depth, highest=False)
+    else:
+        logger.error("Book state remains invalid after cleanup")
+        return None, [], []
+
+
+class DepthReplayer:
+    """
+    Reconstructs order books from one depth DataFrame. The completed
+    snapshots are found once and kept sorted by end timestamp, so each
+    query is a binary search instead of a rescan of the whole DataFrame.
+    """
+
+    def __init__(self, df_depth: pd.DataFrame):
+        _validate_schema(df_depth)
+        self.df_depth = df_depth
+
+        # Column arrays the replay slices by row position. Integer columns
+        # keep their stored width (see DEPTH_DTYPES), the replay reads them
+        # as-is; price is decoded once to the level price dtype
+        self.cmd   = df_depth['command'].to_numpy()
+        self.price = df_depth['price'].to_numpy(np.float64)
+        self.qty   = df_depth['quantity'].to_numpy()
+        self.nord  = df_depth['num_orders'].to_numpy()
+        self.ts    = df_depth['timestamp'].to_numpy(np.int64)
+
+        start_pos, end_pos = _snapshot_positions(df_depth)
+        end_ts = self.ts[end_pos]
+        order = np.argsort(end_ts, kind='stable')
+        self.start_pos = start_pos[order]
+        self.end_pos   = end_pos[order]
+        self.end_ts    = end_ts[order]
+
+        # Book state of the last replay: snapshot start, next row, levels
+        self._start  = -1
+        self._next   = -1
+        self._levels = EMPTY_LEVELS
+
+    def _replay(self, p0: int, p1: int) -> BookLevels:
+        """
+        Book levels after applying rows p0..p1-1. Successive queries usually
+        hit the same snapshot (same CLEAR_BOOK start) further along, so the
+        previous state is advanced by the new rows only instead of replaying
+        the snapshot from its start.
+        """
+        if p0 == self._start and self._next <= p1:
+            levels, a = self._levels, self._next
+        else:
+            levels, a = EMPTY_LEVELS, p0
+
+        self._levels = advance_levels(
+            levels, self.cmd[a:p1], self.price[a:p1], self.qty[a:p1], self.nord[a:p1]
+        )
+        self._start, self._next = p0, p1
+        return self._levels
+
+    def _snapshot_at(self, target_ts: int) -> int:
+        """
+        Position in the sorted snapshot arrays of the last snapshot ending
+        at or before target_ts, or -1 if there is none.
+        """
+        i = np.searchsorted(self.end_ts, target_ts, side='right') - 1
+        if i < 0:
+            return -1
+        # Several snapshots can end on the same timestamp; take the first
+        return int(np.searchsorted(self.end_ts, self.end_ts[i], side='left'))
+
+    def last_snapshot(self, target_ts: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Returns the (start_idx, end_idx, start_ts, end_ts) of the last
+        snapshot ending at or before target_ts, or None if there is none.
+        """
+        i = self._snapshot_at(target_ts)
+        if i < 0:
+            return None
+        s, e = self.start_pos[i], self.end_pos[i]
+        idx = self.df_depth.index
+        return idx[s], idx[e], int(self.ts[s]), int(self.end_ts[i])
+
+    def reconstruct(
+        self,
+        target_ts: int,
+        max_depth: int = 10,
+        strict: bool = False
+    ) -> Tuple[Optional[int], List[Tuple[float, int, int]], List[Tuple[float, int, int]]]:
+        """
+        Reconstructs the order book state from the last fully completed snapshot
+        before or at target_ts. See reconstruct_book_last_full_snapshot().
+        """
+        try:
+            if not len(self.end_ts):
+                logger.info("No completed snapshots found")
+                return None, [], []
+
+            # Take the most recent snapshot ending before/at target_ts
+            i = self._snapshot_at(target_ts)
+            if i < 0:
+                logger.info(f"No snapshots found before target timestamp {target_ts}")
+                return None, [], []
+
+            p0, p1 = int(self.start_pos[i]), int(self.end_pos[i]) + 1
+            end_ts = int(self.end_ts[i])
+            logger.debug(f"Using snapshot from row {p0} to {p1 - 1}")
+
+            # Reconstruct the book from the snapshot rows
+            levels = self._replay(p0, p1)
+            return _top_of_book(levels, end_ts, max_depth, strict)
+
+        except Exception as e:
+            logger.error(f"Error reconstructing book: {e}")
+            return None, [], []
+
+
 def reconstruct_book_last_full_snapshot(
     df_depth: pd.DataFrame, 
     target_ts: int, 
-    max_depth: int = 10
+    max_depth: int = 10,
+    strict: bool = False
 ) -> Tuple[Optional[int], List[Tuple[float, int, int]], List[Tuple[float, int, int]]]:
     """
     Reconstructs the order book state from the last fully completed snapshot
-    before or at target_ts.
+    before or at target_ts. On time-ordered data only rows up to target_ts
+    are scanned; for repeated queries against the same data, build a
+    DepthReplayer once and call its reconstruct() instead.
 
     Args:
         df_depth: DataFrame with depth records
         target_ts: Target timestamp (Sierra Chart microseconds)
         max_depth: Maximum number of levels to return per side
+        strict: Validate the book and clean up crossed levels (moving them
+                to the side of the bid/ask midpoint they fall on); without
+                it the replayed book is returned as-is
 
     Returns:
         Tuple of:
@@ -158,63 +509,24 @@ def reconstruct_book_last_full_snapshot(
         - asks_top: List of (price, qty, num_orders) tuples for ask side
     """
     try:
-        # Find all completed snapshots
-        snapshots = find_completed_snapshots(df_depth)
-        if not snapshots:
-            logger.info("No completed snapshots found")
-            return None, [], []
+        _validate_schema(df_depth)
 
-        # Find last snapshot ending before/at target_ts
-        valid_snaps = [(s, e, sts, ets) for (s, e, sts, ets) in snapshots if ets <= target_ts]
-        if not valid_snaps:
+        # Find the last snapshot ending before/at target_ts
+        snap = _last_snapshot_positions(df_depth, target_ts)
+        if snap is None:
             logger.info(f"No snapshots found before target timestamp {target_ts}")
             return None, [], []
 
-        # Take the most recent valid snapshot
-        start_idx, end_idx, start_ts, end_ts = max(valid_snaps, key=lambda x: x[3])
-        logger.debug(f"Using snapshot from index {start_idx} to {end_idx}")
-
-        # Extract and sort snapshot rows
-        df_snap = df_depth.loc[start_idx:end_idx].copy()
-        df_snap.sort_index(inplace=True)
-
-        # Reconstruct the book
-        bids: Dict[float, Tuple[int, int]] = {}  # price -> (qty, num_orders)
-        asks: Dict[float, Tuple[int, int]] = {}
+        p0, p1 = snap[0], snap[1] + 1
+        end_ts = int(df_depth['timestamp'].iat[snap[1]])
+        logger.debug(f"Using snapshot from row {p0} to {p1 - 1}")
 
-        for _, row in df_snap.iterrows():
-            apply_depth_update(bids, asks, row)
+        # Reconstruct the book from the snapshot rows
+        levels = advance_levels(EMPTY_LEVELS, *(
+            df_depth[col].to_numpy()[p0:p1] for col in ('command', 'price', 'quantity', 'num_orders')
+        ))
+        return _top_of_book(levels, end_ts, max_depth, strict)
 
-        # Validate the book state
-        if not validate_book_state(bids, asks):
-            logger.warning(f"Invalid book state detected, attempting cleanup...")
-            
-            # Find the boundary between valid bids and asks
-            all_prices = sorted(list(bids.keys()) + list(asks.keys()))
-            if len(all_prices) > 1:
-                mid_price = (all_prices[0] + all_prices[-1]) / 2
-                # Move misplaced orders to correct side
-                for price in list(bids.keys()):
-                    if price >= mid_price:
-                        asks[price] = bids[price]
-                        del bids[price]
-                for price in list(asks.keys()):
-                    if price < mid_price:
-                        bids[price] = asks[price]
-                        del asks[price]
-
-        # Sort and format the results
-        bids_list = sorted(((p, q, n) for p, (q, n) in bids.items()), reverse=True)
-        asks_list = sorted(((p, q, n) for p, (q, n) in asks.items()))
-
-        logger.debug(f"Reconstructed book with {len(bids_list)} bids and {len(asks_list)} asks")
-        
-        if validate_book_state(bids, asks):
-            return end_ts, bids_list[:max_depth], asks_list[:max_depth]
-        else:
-            logger.error("Book state remains invalid after cleanup")
-            return None, [], []
-        
     except Exception as e:
         logger.error(f"Error reconstructing book: {e}")
         return None, [], []
@@ -233,6 +545,70 @@ def format_book_side(levels: List[Tuple[float, int, int]], side: str = "Bids") -
     return "\n".join(result)
 
 
+@lru_cache(maxsize=1)
+def _get_lib():
+    """
+    Connect to the Arctic library on first use (once per process).
+    """
+    return Arctic(ARCTIC_HOST)[LIB_NAME]
+
+
+def reconstruct_for_symbol(
+    symbol: str,
+    target_ts: Optional[int] = None,
+    max_depth: int = 10
+) -> Tuple[int, Optional[int], List[Tuple[float, int, int]], List[Tuple[float, int, int]]]:
+    """
+    Loads one depth symbol from Arctic and reconstructs its book at
+    target_ts (default: the timestamp 20 rows from the end).
+    Returns (target_ts, snapshot_ts, bids_top, asks_top).
+    """
+    # Only the replay columns are read, and with a known target the rows
+    # after it are filtered out by Arctic (a row filter, so it holds for
+    # any row order; the symbols have a row index, so date_range does not
+    # apply)
+    query = None
+    if target_ts is not None:
+        query = QueryBuilder()
+        query = query[query['timestamp'] <= target_ts]
+
+    logger.info(f"Reading depth data: {symbol}")
+    df_depth = _get_lib().read(symbol, columns=DEPTH_COLUMNS, query_builder=query).data
+    logger.info(f"Loaded {len(df_depth)} depth records")
+
+    # Narrow the columns once (a no-op for data written by etl_arctic.py),
+    # so the replay reads them at their record widths
+    df_depth = df_depth.astype(DEPTH_DTYPES)
+
+    if target_ts is None:
+        target_ts = int(df_depth['timestamp'].iloc[-20])
+    logger.info(f"Target timestamp: {target_ts}")
+
+    snapshot_ts, bids, asks = reconstruct_book_last_full_snapshot(
+        df_depth, target_ts, max_depth=max_depth
+    )
+    return target_ts, snapshot_ts, bids, asks
+
+
+def reconstruct_symbols(
+    symbols: List[str],
+    target_tss: Optional[List[Optional[int]]] = None,
+    max_workers: Optional[int] = None
+) -> list:
+    """
+    Runs reconstruct_for_symbol() for each symbol. Symbols are independent,
+    so several are spread over worker processes, each reading its own data.
+    """
+    if target_tss is None:
+        target_tss = [None] * len(symbols)
+
+    if len(symbols) == 1:
+        return [reconstruct_for_symbol(symbols[0], target_tss[0])]
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(reconstruct_for_symbol, symbols, target_tss))
+
+
 def main():
     # Configure logging
     logging.basicConfig(
@@ -241,56 +617,37 @@ def main():
     )
     
     try:
-        # Connect to Arctic and load data
-        ARCTIC_HOST = "mongodb://localhost:27017"
-        LIB_NAME = "tick_data"
-        DEPTH_SYMBOL = "NQH25_FUT_CME_depth"
-
-        store = Arctic(ARCTIC_HOST)
-        arctic_lib = store[LIB_NAME]
-        
-        logger.info(f"Reading depth data: {DEPTH_SYMBOL}")
-        df_depth = arctic_lib.read(DEPTH_SYMBOL).data
-        logger.info(f"Loaded {len(df_depth)} depth records")
-
-        # Ensure flags are integers
-        df_depth['flags'] = df_depth['flags'].astype(int)
+        # Depth symbols to reconstruct, e.g. NQH25_FUT_CME_depth
+        symbols = sys.argv[1:] or [DEPTH_SYMBOL]
+        results = reconstruct_symbols(symbols)
 
-        # Pick a target timestamp (e.g., 20 rows from end)
-        target_ts = df_depth['timestamp'].iloc[-20]
-        logger.info(f"Target timestamp: {target_ts}")
-
-        # Reconstruct the book
-        snapshot_ts, bids, asks = reconstruct_book_last_full_snapshot(
-            df_depth, target_ts, max_depth=10
-        )
-
-        if snapshot_ts is None:
-            logger.warning(f"No completed snapshot found before timestamp {target_ts}")
-            return
-        
         # Import timestamp utils
         from timestamp_utils import ts_to_ds
 
-        # Convert timestamps to readable datetime strings
-        target_time = ts_to_ds(target_ts)
-        snapshot_time = ts_to_ds(snapshot_ts)
-
-        # Log the results
-        logger.info("\nOrder Book Reconstruction")
-        logger.info("-" * 40)
-        logger.info(f"Target Time:   {target_time} CT")
-        logger.info(f"Snapshot Time: {snapshot_time} CT")
-        logger.info(f"Latency (μs):  {target_ts - snapshot_ts}")
-        logger.info("\nPrice     Quantity  #Orders")
-        logger.info("-" * 30)
-        
-        logger.info(format_book_side(asks, "Asks"))
-        logger.info(format_book_side(bids, "Bids"))
+        for symbol, (target_ts, snapshot_ts, bids, asks) in zip(symbols, results):
+            if snapshot_ts is None:
+                logger.warning(f"{symbol}: no completed snapshot found before timestamp {target_ts}")
+                continue
+
+            # Convert timestamps to readable datetime strings
+            target_time = ts_to_ds(target_ts)
+            snapshot_time = ts_to_ds(snapshot_ts)
+
+            # Log the results
+            logger.info(f"\nOrder Book Reconstruction: {symbol}")
+            logger.info("-" * 40)
+            logger.info(f"Target Time:   {target_time} CT")
+            logger.info(f"Snapshot Time: {snapshot_time} CT")
+            logger.info(f"Latency (μs):  {target_ts - snapshot_ts}")
+            logger.info("\nPrice     Quantity  #Orders")
+            logger.info("-" * 30)
+            
+            logger.info(format_book_side(asks, "Asks"))
+            logger.info(format_book_side(bids, "Bids"))
         
     except Exception as e:
         logger.error(f"Error in main: {e}", exc_info=True)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,14 +4,31 @@ sym_it.py
 
 Synchronized iteration of T&S and Depth records for a single day.
 """
-from bisect import bisect_right
 from json   import loads
 from time   import time
 
-from parsers import depth_rec, tas_rec, parse_tas, parse_tas_header, parse_depth, parse_depth_header
+from numpy   import argsort, concatenate, empty, ndarray, searchsorted
+from parsers import (
+    depth_rec, tas_rec, DEPTH_DTYPE, DEPTH_HEADER_LEN, TAS_DTYPE,
+    parse_tas, parse_tas_header, parse_depth, parse_depth_header
+)
 
 SC_ROOT = loads(open("./config.json").read())["sc_root"]
 
+def _append(buf: ndarray, n: int, new: ndarray) -> ndarray:
+    """
+    Copy new records in after the first n of buf, doubling its capacity
+    when full so repeated polls stay amortized linear. Returns the
+    (possibly reallocated) buffer.
+    """
+    end = n + len(new)
+    if end > len(buf):
+        grown     = empty(max(end, 2 * len(buf)), dtype=buf.dtype)
+        grown[:n] = buf[:n]
+        buf       = grown
+    buf[n:end] = new
+    return buf
+
 class SymIt:
 
     def __init__(self, symbol: str, date: str, ts: int = 0):
@@ -20,8 +37,9 @@ class SymIt:
         self.ts     = ts
 
         self.sync       = False
-        self.tas_recs   = []
-        self.lob_recs   = []
+        self.tas_buf    = empty(0, dtype=TAS_DTYPE)
+        self.tas_recs   = self.tas_buf
+        self.lob_recs   = empty(0, dtype=DEPTH_DTYPE)
         self.tas_i      = 0
         self.lob_i      = 0
 
@@ -33,16 +51,24 @@ class SymIt:
 
     def synchronize(self, update: bool):
         if update:
-            self.tas_recs += parse_tas(self.tas_fd, 0)
-            self.lob_recs += parse_depth(self.lob_fd, 0)
+            new           = parse_tas(self.tas_fd, 0)
+            n             = len(self.tas_recs)
+            self.tas_buf  = _append(self.tas_buf, n, new)
+            self.tas_recs = self.tas_buf[:n + len(new)]
 
-        self.lob_i = bisect_right(self.lob_recs, self.ts, key=lambda r: r[depth_rec.timestamp])
-        if self.lob_i < len(self.lob_recs):
-            self.ts = self.lob_recs[self.lob_i][depth_rec.timestamp]
+            # depth files only grow: re-view the whole file (zero-copy)
+            self.lob_fd.seek(DEPTH_HEADER_LEN)
+            self.lob_recs = parse_depth(self.lob_fd, 0)
+
+        lob_ts = self.lob_recs["timestamp"]
+
+        self.lob_i = int(searchsorted(lob_ts, self.ts, side="right"))
+        if self.lob_i < len(lob_ts):
+            self.ts = lob_ts[self.lob_i]
         else:
-            self.ts = self.lob_recs[-1][depth_rec.timestamp]
+            self.ts = lob_ts[-1]
 
-        self.tas_i = bisect_right(self.tas_recs, self.ts, key=lambda r: r[tas_rec.timestamp])
+        self.tas_i = int(searchsorted(self.tas_recs["timestamp"], self.ts, side="right"))
 
     def set_ts(self, ts: int, update: bool = False):
         self.ts   = ts
@@ -69,12 +95,21 @@ class SymIt:
         return res
 
     def all(self):
-        res = []
         old_ts = self.ts
-        update = not (self.lob_recs or self.tas_recs)
+        update = not (len(self.lob_recs) or len(self.tas_recs))
         self.set_ts(0, update)
-        for r in self:
-            res.append(r)
+        self.synchronize(True)  # as iter(self) would
+
+        # Merge in one sort instead of stepping __next__: every remaining
+        # depth record plus the trades up to the last one, trades first on
+        # equal timestamps (stable sort, trades concatenated first)
+        lob     = self.lob_recs[self.lob_i:]
+        tas_end = searchsorted(self.tas_recs["timestamp"], self.lob_recs["timestamp"][-1], side="right")
+        tas     = self.tas_recs[self.tas_i:tas_end]
+        order   = argsort(concatenate((tas["timestamp"], lob["timestamp"])), kind="stable")
+
+        recs = [*tas, *lob]
+        res  = [recs[i] for i in order.tolist()]
         self.set_ts(old_ts)
         return res
 
@@ -86,7 +121,7 @@ class SymIt:
         else:
             # interpret as timestamp-based slice
             old_ts = self.ts
-            update = not (self.lob_recs or self.tas_recs)
+            update = not (len(self.lob_recs) or len(self.tas_recs))
             self.set_ts(slice.start, update)
             for r in self:
                 ts_val = r[0]  # the timestamp
@@ -6,7 +6,8 @@ Utilities for converting Sierra Chart timestamps to datetimes (and back).
 """
 
 from datetime    import datetime
-from numpy       import datetime64, timedelta64
+from functools   import lru_cache
+from numpy       import array, asarray, char, datetime64, datetime_as_string, ndarray, timedelta64
 from json        import loads
 
 # read config so we know the UTC offset
@@ -16,7 +17,10 @@ CONFIG = loads(open("./config.json").read())
 UTC_OFFSET_US = timedelta64(int(CONFIG["utc_offset"] * 3.6e9), "us")
 SC_EPOCH      = datetime64("1899-12-30") + UTC_OFFSET_US
 
-def ts_to_ds(ts: int, fmt: str = "%Y-%m-%d %H:%M:%S.%f") -> str:
+DS_FMT = "%Y-%m-%d %H:%M:%S.%f"
+
+@lru_cache(maxsize=4096)
+def ts_to_ds(ts: int, fmt: str = DS_FMT) -> str:
     """
     Convert a Sierra Chart timestamp (microseconds since SC_EPOCH)
     to a human-readable datetime string.
@@ -24,6 +28,18 @@ def ts_to_ds(ts: int, fmt: str = "%Y-%m-%d %H:%M:%S.%f") -> str:
     # (SC_EPOCH + ts) => datetime64 => standard Python datetime => string
     return (SC_EPOCH + timedelta64(ts, "us")).astype(datetime).strftime(fmt)
 
+def ts_to_ds_array(ts: ndarray, fmt: str = DS_FMT) -> ndarray:
+    """
+    Vectorized ts_to_ds: convert an array of Sierra Chart timestamps to an
+    array of datetime strings. The default format is produced by NumPy in
+    bulk; any other format falls back to strftime per element.
+    """
+    dt = SC_EPOCH + asarray(ts, dtype="int64").astype("timedelta64[us]")
+    if fmt == DS_FMT:
+        ds = datetime_as_string(dt, unit="us")
+        return char.replace(ds, "T", " ") if ds.size else ds
+    return array([d.strftime(fmt) for d in dt.astype(datetime)])
+
 def ds_to_ts(ds: str) -> int:
     """
     Convert a string datetime (YYYY-mm-dd HH:MM:SS, etc.) back into
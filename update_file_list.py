@@ -8,7 +8,7 @@ generates a list of file IDs for bulk downloading in Sierra Chart.
 Usage:
     python update_file_list.py N23 Z23
 """
-from sys import argv
+from sys import argv, stdout
 
 SYMBOLS = [
     # ( "CL{MYY}_FUT_CME", "FGHJKMNQUVXZ", True ), # etc...
@@ -17,9 +17,11 @@ SYMBOLS = [
     # add more as needed...
 ]
 
-if __name__ == "__main__":
-    start = (argv[1][0], argv[1][1:])
-    end   = (argv[2][0], argv[2][1:])
+def contract_ids(start: tuple, end: tuple):
+    """
+    Yield the contract IDs of every enabled symbol between the start and
+    end (month, year) codes, inclusive.
+    """
     years = [str(i) for i in range(int(start[1]), int(end[1]) + 1)]
 
     for symbol in SYMBOLS:
@@ -30,29 +32,29 @@ if __name__ == "__main__":
         months  = symbol[1]
         opt     = "OPT" in pattern
 
+        if opt:
+            # Strike strings are the same for every expiry, build them once
+            lo_strike, hi_strike, increment, fill_width = map(int, symbol[2].split(":"))
+            strikes = [f"{i:0{fill_width}d}" for i in range(lo_strike, hi_strike + increment, increment)]
+
         for year in years:
             for month in months:
-                myy = month + year
-
                 if (year == start[1] and month < start[0]) or \
                    (year == end[1]   and month > end[0]):
                     continue
 
+                myy = month + year
+
                 if not opt:
-                    contract_id = pattern.format(MYY=myy)
-                    print(contract_id)
+                    yield pattern.format(MYY=myy)
                 else:
-                    strike_def = symbol[2].split(":")
-                    lo_strike  = int(strike_def[0])
-                    hi_strike  = int(strike_def[1])
-                    increment  = int(strike_def[2])
-                    fill_width = int(strike_def[3])
-
-                    for ttype in ["C", "P"]:
-                        for i in range(lo_strike, hi_strike + increment, increment):
-                            contract_id = pattern.format(
-                                MYY=myy, 
-                                T=ttype, 
-                                S=str(i).rjust(fill_width, "0")
-                            )
-                            print(contract_id)
+                    for ttype in "CP":
+                        for strike in strikes:
+                            yield pattern.format(MYY=myy, T=ttype, S=strike)
+
+if __name__ == "__main__":
+    start = (argv[1][0], argv[1][1:])
+    end   = (argv[2][0], argv[2][1:])
+
+    # One write for the whole list instead of a print() per contract
+    stdout.write("".join(f"{contract_id}\n" for contract_id in contract_ids(start, end)))